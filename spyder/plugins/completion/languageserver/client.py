@@ -79,7 +79,8 @@ class LSPClient(QObject, LSPMethodProviderMixIn):
     def __init__(self, parent,
                  server_settings={},
                  folder=getcwd_or_home(),
-                 language='python'):
+                 language='python',
+                 prior_port=None):
         QObject.__init__(self)
         self.manager = parent
         self.zmq_in_socket = None
@@ -102,18 +103,14 @@ class LSPClient(QObject, LSPMethodProviderMixIn):
         self.server_unresponsive = False
         self.transport_unresponsive = False
 
-        # Select a free port to start the server.
-        # NOTE: Don't use the new value to set server_setttings['port']!!
-        # That's not required because this doesn't really correspond to a
-        # change in the config settings of the server. Else a server
-        # restart would be generated when doing a
-        # workspace/didChangeConfiguration request.
-        if not server_settings['external']:
-            self.server_port = select_port(
-                default_port=server_settings['port'])
-        else:
-            self.server_port = server_settings['port']
+        # The actual port is selected when the client is started (see
+        # select_server_port), so that creating an instance doesn't
+        # perform any network activity. If a port already verified by a
+        # previous client of this session is given, it's reused without
+        # probing it again.
+        self.server_port = server_settings['port']
         self.server_host = server_settings['host']
+        self.prior_port = prior_port
 
         self.external_server = server_settings.get('external', False)
         self.stdio = server_settings.get('stdio', False)
@@ -229,6 +226,28 @@ class LSPClient(QObject, LSPMethodProviderMixIn):
 
         return args
 
+    def select_server_port(self):
+        """
+        Select a free port to start the server, trying the configured
+        one first.
+
+        NOTE: Don't use the new value to set server_setttings['port']!!
+        That's not required because this doesn't really correspond to a
+        change in the config settings of the server. Else a server
+        restart would be generated when doing a
+        workspace/didChangeConfiguration request.
+        """
+        if not self.external_server:
+            if self.prior_port is not None:
+                # This port was successfully bound by a previous client
+                # of this session, so it's ours and can be reused
+                # without a new probe.
+                self.server_port = self.prior_port
+            else:
+                self.server_port = select_port(
+                    default_port=self.server_port)
+        return self.server_port
+
     def create_transport_sockets(self):
         """Create PyZMQ sockets for transport."""
         self.zmq_out_socket = self.context.socket(zmq.PAIR)
@@ -332,6 +351,7 @@ class LSPClient(QObject, LSPMethodProviderMixIn):
     def start(self):
         """Start client."""
         # NOTE: DO NOT change the order in which these methods are called.
+        self.select_server_port()
         self.create_transport_sockets()
         self.start_server()
         self.start_transport()
@@ -353,7 +373,9 @@ class LSPClient(QObject, LSPMethodProviderMixIn):
             self.notifier = None
         if self.transport is not None:
             self.transport.kill()
-        self.context.destroy()
+        # Don't wait for pending messages to be delivered: the process
+        # at the other end of these sockets was just killed.
+        self.context.destroy(linger=0)
         if self.server is not None:
             self.server.kill()
 
@@ -1320,9 +1320,9 @@ class LanguageServerConfigPage(GeneralConfigPage):
             lsp = self.main.completions.get_client('lsp')
             pyclient = lsp.clients.get('python')
             if pyclient is not None:
-                instance = pyclient['instance']
+                instance = pyclient.instance
                 if (instance is not None and
-                        not pyclient['config']['external']):
+                        not pyclient.config['external']):
                     if (instance.server_host == host and
                             instance.server_port == port):
                         self.report_no_address_change()
@@ -10,11 +10,16 @@ in our Preferences.
 """
 
 # Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from enum import IntEnum
 import functools
 import logging
 import os
 import os.path as osp
+from operator import itemgetter
 import sys
+import threading
 
 # Third-party imports
 from qtpy.QtCore import Signal, Slot, QTimer
@@ -37,6 +42,42 @@ from spyder.widgets.helperwidgets import MessageCheckBox
 
 logger = logging.getLogger(__name__)
 
+# Languages a server can be configured for, lowercased once at import
+# time so config lookups don't rebuild the list on every call.
+LSP_LANGUAGES_LOWERCASE = frozenset(l.lower() for l in LSP_LANGUAGES)
+
+# Options that demand a server restart to be applied, extracted from a
+# config in a single call for comparison purposes.
+RESTART_OPTIONS = itemgetter('cmd', 'args', 'host', 'port', 'external',
+                             'stdio')
+
+
+class ClientStatus(IntEnum):
+    """
+    Status of a language client.
+
+    An integer enum so the comparisons done on every LSP message boil
+    down to a plain integer compare.
+    """
+    STOPPED = 0
+    RUNNING = 1
+
+
+class _ClientEntry(object):
+    """
+    Bookkeeping for the client of a given language.
+
+    This is a slotted class instead of a plain dict because its fields
+    are read on every request sent to a server (i.e. per keystroke), and
+    slot access is both faster and smaller than dict lookups.
+    """
+    __slots__ = ('status', 'config', 'instance')
+
+    def __init__(self, status, config):
+        self.status = status
+        self.config = config
+        self.instance = None
+
 
 class LanguageServerPlugin(SpyderCompletionPlugin):
     """Language Server Protocol manager."""
@@ -44,13 +85,14 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
     CONF_FILE = False
 
     COMPLETION_CLIENT_NAME = 'lsp'
-    STOPPED = 'stopped'
-    RUNNING = 'running'
+    STOPPED = ClientStatus.STOPPED
+    RUNNING = ClientStatus.RUNNING
     LOCALHOST = ['127.0.0.1', 'localhost']
     CONFIGWIDGET_CLASS = LanguageServerConfigPage
     MAX_RESTART_ATTEMPTS = 5
     TIME_BETWEEN_RESTARTS = 10000  # ms
     TIME_HEARTBEAT = 3000  # ms
+    TIME_CONFIG_UPDATE = 100  # ms
 
     # --- Signals
     # ------------------------------------------------------------------------
@@ -87,6 +129,38 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         self.clients_statusbar = {}
         self.requests = set({})
         self.register_queue = {}
+
+        # Languages with a server configured in our Preferences. Their
+        # client entries are only created on first use (see
+        # _ensure_client), so startup doesn't pay for servers the
+        # session never touches.
+        self._configured_languages = set()
+
+        # Ports already bound successfully during this session, as
+        # language -> (configured port, selected port). A restart for
+        # which the configured port didn't change reuses the selected
+        # one instead of probing again.
+        self._verified_ports = {}
+
+        # Root paths resolved per (language, project path), so repeated
+        # client starts don't stat the filesystem again. Cleared when
+        # the project path changes.
+        self._root_path_cache = {}
+
+        # Lock to prevent concurrent client starts/stops from leaving
+        # the status of sibling entries in an inconsistent state.
+        self._clients_lock = threading.Lock()
+
+        # Timer to collapse bursts of configuration changes (e.g.
+        # several preference edits in a row) into a single update, so
+        # servers are not restarted once per edited option.
+        self._update_configuration_timer = QTimer(self)
+        self._update_configuration_timer.setSingleShot(True)
+        self._update_configuration_timer.setInterval(self.TIME_CONFIG_UPDATE)
+        self._update_configuration_timer.timeout.connect(
+            self._run_scheduled_configuration_update)
+        self._scheduled_python_only = True
+
         self.update_configuration()
 
         self.show_no_external_server_warning = True
@@ -104,11 +178,8 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
     # --- Status bar widget handling
     def restart_lsp(self, language, force=False):
         """Restart language server on failure."""
-        client_config = {
-            'status': self.STOPPED,
-            'config': self.get_language_config(language),
-            'instance': None,
-        }
+        client_config = _ClientEntry(
+            self.STOPPED, self.get_language_config(language))
 
         if force:
             logger.info("Manual restart for {}...".format(language))
@@ -134,9 +205,9 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
                 self.clients_restart_timers[language] = None
                 try:
                     self.clients_hearbeat[language].stop()
-                    client['instance'].disconnect()
-                    client['instance'].stop()
-                except (TypeError, KeyError, RuntimeError):
+                    client.instance.disconnect()
+                    client.instance.stop()
+                except (AttributeError, TypeError, KeyError, RuntimeError):
                     pass
                 self.clients_hearbeat[language] = None
                 self.report_lsp_down(language)
@@ -146,8 +217,8 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         Check if a server restart was successful in order to stop
         further attempts.
         """
-        status = client['status']
-        instance = client['instance']
+        status = client.status
+        instance = client.instance
 
         # This check is only necessary for stdio servers
         check = True
@@ -167,8 +238,8 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         Check if client or server for a given language are down.
         """
         client = self.clients[language]
-        status = client['status']
-        instance = client.get('instance', None)
+        status = client.status
+        instance = client.instance
         if instance is not None:
             if instance.is_down() or status != self.RUNNING:
                 instance.sig_went_down.emit(language)
@@ -199,6 +270,9 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         """
         if (not self.clients_restarting.get(language, False)
                 and not running_under_pytest()):
+            # The port can't be trusted anymore after a failure, so the
+            # next start probes for one again.
+            self._verified_ports.pop(language, None)
             try:
                 self.clients_hearbeat[language].stop()
             except KeyError:
@@ -217,25 +291,44 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
             timer.start()
 
     # --- Other methods
+    def _ensure_client(self, language):
+        """
+        Get the client entry for a language, creating it on first use.
+
+        Returns None if no server is configured for the language.
+        """
+        language_client = self.clients.get(language)
+        if language_client is None:
+            if language not in self._configured_languages:
+                return None
+            config = self.get_language_config(language)
+            # Entry and queue are installed under the lock so that a
+            # register_file racing with a bulk start can't see one
+            # without the other.
+            with self._clients_lock:
+                language_client = self.clients.get(language)
+                if language_client is None:
+                    language_client = _ClientEntry(self.STOPPED, config)
+                    self.clients[language] = language_client
+                    self.register_queue[language] = []
+        return language_client
+
     def register_file(self, language, filename, codeeditor):
-        if language in self.clients:
-            language_client = self.clients[language]['instance']
-            if language_client is None:
+        language_client = self._ensure_client(language)
+        if language_client is not None:
+            if language_client.instance is None:
                 self.register_queue[language].append((filename, codeeditor))
             else:
-                language_client.register_file(filename, codeeditor)
+                language_client.instance.register_file(filename, codeeditor)
 
     def get_languages(self):
         """
         Get the list of languages we need to start servers and create
         clients for.
         """
-        languages = ['python']
-        all_options = CONF.options(self.CONF_SECTION)
-        for option in all_options:
-            if option in [l.lower() for l in LSP_LANGUAGES]:
-                languages.append(option)
-        return languages
+        return ['python'] + [
+            option for option in CONF.options(self.CONF_SECTION)
+            if option in LSP_LANGUAGES_LOWERCASE]
 
     def get_language_config(self, language):
         """Get language configuration options from our config system."""
@@ -251,12 +344,20 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         This can be the current project path or the output of
         getcwd_or_home (except for Python, see below).
         """
-        path = None
-
         # Get path of the current project
+        project_path = None
         if self.main and self.main.projects:
-            path = self.main.projects.get_active_project_path()
+            project_path = self.main.projects.get_active_project_path()
 
+        # Resolving the fallback path below hits the filesystem, so
+        # results are cached per project path.
+        key = (language, project_path)
+        try:
+            return self._root_path_cache[key]
+        except KeyError:
+            pass
+
+        path = project_path
         if not path:
             # We can't use getcwd_or_home for LSP servers because if it
             # returns home and you have a lot of files on it
@@ -268,6 +369,7 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
             if not osp.exists(path):
                 os.mkdir(path)
 
+        self._root_path_cache[key] = path
         return path
 
     @Slot()
@@ -280,10 +382,10 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         If the server doesn't support workspace updates, restart the
         client with the new root path.
         """
-        for language in self.clients:
-            language_client = self.clients[language]
-            if language_client['status'] == self.RUNNING:
-                instance = language_client['instance']
+        self._root_path_cache.clear()
+        for language, language_client in list(self.clients.items()):
+            if language_client.status == self.RUNNING:
+                instance = language_client.instance
                 if (instance.support_multiple_workspaces and
                         instance.support_workspace_update):
                     logger.debug(
@@ -296,13 +398,18 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
                         'kind': update_kind
                     })
                 else:
+                    folder = self.get_root_path(language)
+                    if instance.folder == folder:
+                        # The root path this client runs with didn't
+                        # actually change, so there's no need to pay
+                        # for a restart.
+                        continue
                     logger.debug(
                         "{0}: LSP does not support multiple workspaces, "
                         "restarting client!".format(instance.language)
                     )
                     self.main.projects.stop_lsp_services()
                     self.main.editor.stop_completion_services(language)
-                    folder = self.get_root_path(language)
                     instance.folder = folder
                     self.close_client(language)
                     self.start_client(language)
@@ -404,73 +511,114 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
 
     def start_client(self, language):
         """Start an LSP client for a given language."""
-        # To keep track if the client was started.
-        started = False
+        language_client = self._prepare_client_start(language)
+        if language_client is not None:
+            self._finish_client_start(language, language_client)
 
-        if language in self.clients:
-            language_client = self.clients[language]
+        language_client = self.clients.get(language)
+        return (language_client is not None and
+                language_client.status == self.RUNNING)
 
-            queue = self.register_queue[language]
+    def _prepare_client_start(self, language):
+        """
+        Perform the Qt side of a client start, i.e. creating the client
+        instance with its heartbeat timer and registering its signals.
+
+        All of this must run on the main thread, as opposed to the
+        blocking part done by `_finish_client_start`. Returns the
+        client entry when that part still needs to be run for it,
+        otherwise None.
+        """
+        language_client = self._ensure_client(language)
+        if language_client is None:
+            return None
+
+        # Don't start LSP services when testing unless we demand
+        # them.
+        if running_under_pytest():
+            if not os.environ.get('SPY_TEST_USE_INTROSPECTION'):
+                return None
+
+        # Start client heartbeat
+        timer = QTimer(self)
+        self.clients_hearbeat[language] = timer
+        timer.setInterval(self.TIME_HEARTBEAT)
+        timer.timeout.connect(lambda: self.check_heartbeat(language))
+        timer.start()
+
+        if language_client.status != self.STOPPED:
+            return None
+
+        config = language_client.config
+
+        # If we're trying to connect to an external server,
+        # verify that it's listening before creating a
+        # client for it.
+        if config['external']:
+            host = config['host']
+            port = config['port']
+            response = check_connection_port(host, port)
+            if not response:
+                if self.show_no_external_server_warning:
+                    self.report_no_external_server(host, port, language)
+                self.set_status(language, _("down"))
+                return None
+
+        # Reuse the port verified by a previous start if the
+        # configured one didn't change in the meantime.
+        prior_port = None
+        verified = self._verified_ports.get(language)
+        if verified is not None and verified[0] == config['port']:
+            prior_port = verified[1]
+
+        language_client.instance = LSPClient(
+            parent=self,
+            server_settings=config,
+            folder=self.get_root_path(language),
+            language=language,
+            prior_port=prior_port
+        )
 
-            # Don't start LSP services when testing unless we demand
-            # them.
-            if running_under_pytest():
-                if not os.environ.get('SPY_TEST_USE_INTROSPECTION'):
-                    return started
+        self.register_client_instance(language_client.instance)
 
-            started = language_client['status'] == self.RUNNING
+        # Register that a client was started.
+        logger.info("Starting LSP client for {}...".format(language))
+        return language_client
 
-            # Start client heartbeat
-            timer = QTimer(self)
-            self.clients_hearbeat[language] = timer
-            timer.setInterval(self.TIME_HEARTBEAT)
-            timer.timeout.connect(lambda: self.check_heartbeat(language))
-            timer.start()
+    def _finish_client_start(self, language, language_client):
+        """
+        Perform the remainder of a client start, i.e. selecting a port
+        for the server, spawning its processes and draining the files
+        queued for it.
 
-            if language_client['status'] == self.STOPPED:
-                config = language_client['config']
-
-                # If we're trying to connect to an external server,
-                # verify that it's listening before creating a
-                # client for it.
-                if config['external']:
-                    host = config['host']
-                    port = config['port']
-                    response = check_connection_port(host, port)
-                    if not response:
-                        if self.show_no_external_server_warning:
-                            self.report_no_external_server(
-                                host, port, language)
-                        self.set_status(language, _("down"))
-                        return False
-
-                language_client['instance'] = LSPClient(
-                    parent=self,
-                    server_settings=config,
-                    folder=self.get_root_path(language),
-                    language=language
-                )
-
-                self.register_client_instance(language_client['instance'])
-
-                # Register that a client was started.
-                logger.info("Starting LSP client for {}...".format(language))
-                language_client['instance'].start()
-                language_client['status'] = self.RUNNING
-                started = True
-                for entry in queue:
-                    language_client['instance'].register_file(*entry)
-                self.register_queue[language] = []
-
-        return started
+        This is kept separate from `start_client` so bulk starts can
+        probe the ports for all their clients first (see
+        `start_all_clients`).
+        """
+        instance = language_client.instance
+        instance.start()
+        if not instance.external_server:
+            self._verified_ports[language] = (
+                language_client.config['port'], instance.server_port)
+
+        # Swap the queue out in one step before draining it, so files
+        # registered while the pending ones are forwarded end up in a
+        # fresh queue instead of mutating the one being iterated.
+        with self._clients_lock:
+            language_client.status = self.RUNNING
+            pending, self.register_queue[language] = (
+                self.register_queue[language], [])
+        instance.register_files(pending)
 
     def register_client_instance(self, instance):
         """Register signals emmited by a client instance."""
         if self.main:
             self.main.sig_pythonpath_changed.connect(
-                functools.partial(self.update_configuration, python_only=True))
+                functools.partial(self.schedule_update_configuration,
+                                  python_only=True))
             self.main.sig_main_interpreter_changed.connect(
-                functools.partial(self.update_configuration, python_only=True))
+                functools.partial(self.schedule_update_configuration,
+                                  python_only=True))
             instance.sig_went_down.connect(self.handle_lsp_down)
             instance.sig_initialize.connect(self.on_initialize)
 
@@ -485,11 +633,75 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
                 instance.sig_initialize.connect(
                     self.main.projects.register_lsp_server_settings)
 
+    @staticmethod
+    def _probe_server_port(language_client):
+        """
+        Probe a free port for a client ahead of its start.
+
+        The probed port is recorded as the client's prior port, so the
+        start that follows reuses it instead of probing again. This is
+        plain socket code, safe to run away from the main thread.
+        """
+        instance = language_client.instance
+        instance.prior_port = instance.select_server_port()
+
+    def start_all_clients(self, languages):
+        """
+        Start the clients for several languages at once.
+
+        Only the port probes are fanned out to worker threads: the rest
+        of a start creates Qt objects (processes, socket notifier) that
+        must live on the calling thread. Probing is where a bulk start
+        waits on I/O (QProcess.start is non-blocking), so the total
+        wait is given by the slowest probe and not by the sum of all of
+        them.
+        """
+        pending = []
+        for language in languages:
+            language_client = self._prepare_client_start(language)
+            if language_client is not None:
+                pending.append((language, language_client))
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                executor.submit(self._probe_server_port, language_client)
+                for language, language_client in pending]
+        for future in futures:
+            # Propagate probe errors, so bulk starts keep the same
+            # error visibility as single ones.
+            future.result()
+        for language, language_client in pending:
+            self._finish_client_start(language, language_client)
+
     def shutdown(self):
         logger.info("Shutting down LSP manager...")
-        for language in self.clients:
+        # Stopping a client tears down Qt objects (socket notifier,
+        # processes), which Qt only allows from the thread that owns
+        # them, so this loop stays on the main thread. It's still
+        # bounded: LSPClient.stop kills the processes without waiting
+        # and destroys its zmq context with linger=0.
+        for language in list(self.clients):
             self.close_client(language)
 
+    def schedule_update_configuration(self, python_only=False):
+        """
+        Schedule a server configuration update.
+
+        Calls done while the timer is running are collapsed into a
+        single `update_configuration` call once it fires, which is only
+        python_only if all of them were.
+        """
+        self._scheduled_python_only = (
+            self._scheduled_python_only and python_only)
+        self._update_configuration_timer.start()
+
+    def _run_scheduled_configuration_update(self):
+        """Perform the update requested by `schedule_update_configuration`."""
+        python_only = self._scheduled_python_only
+        self._scheduled_python_only = True
+        self.update_configuration(python_only=python_only)
+
     def update_configuration(self, python_only=False):
         """
         Update server configuration after changes done by the user
@@ -498,48 +710,51 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         python_only: bool
             Perform an update only for the Python language server.
         """
-        for language in self.get_languages():
+        self._configured_languages = set(self.get_languages())
+        for language in self._configured_languages:
             if python_only and language != 'python':
                 continue
 
-            client_config = {'status': self.STOPPED,
-                             'config': self.get_language_config(language),
-                             'instance': None}
-            if language not in self.clients:
-                self.clients[language] = client_config
-                self.register_queue[language] = []
-            else:
-                current_lang_config = self.clients[language]['config']
-                new_lang_config = client_config['config']
-                restart_diff = ['cmd', 'args', 'host',
-                                'port', 'external', 'stdio']
-                restart = any([current_lang_config[x] != new_lang_config[x]
-                               for x in restart_diff])
-                if restart:
-                    logger.debug("Restart required for {} client!".format(
-                        language))
-                    if self.clients[language]['status'] == self.STOPPED:
-                        # If we move from an external non-working server to
-                        # an internal one, we need to start a new client.
-                        if (current_lang_config['external'] and
-                                not new_lang_config['external']):
-                            self.restart_client(language, client_config)
-                        else:
-                            self.clients[language] = client_config
-                    elif self.clients[language]['status'] == self.RUNNING:
+            language_client = self.clients.get(language)
+            if language_client is None:
+                # The entry is created on first use with a fresh config
+                # (see _ensure_client), so there's nothing to update.
+                continue
+
+            client_config = _ClientEntry(
+                self.STOPPED, self.get_language_config(language))
+            current_lang_config = language_client.config
+            new_lang_config = client_config.config
+            restart = (RESTART_OPTIONS(current_lang_config) !=
+                       RESTART_OPTIONS(new_lang_config))
+            if restart:
+                logger.debug("Restart required for {} client!".format(
+                    language))
+                if language_client.status == self.STOPPED:
+                    # If we move from an external non-working server to
+                    # an internal one, we need to start a new client.
+                    if (current_lang_config['external'] and
+                            not new_lang_config['external']):
                         self.restart_client(language, client_config)
-                else:
-                    if self.clients[language]['status'] == self.RUNNING:
-                        client = self.clients[language]['instance']
-                        client.send_plugin_configurations(
-                            new_lang_config['configurations'])
+                    else:
+                        self.clients[language] = client_config
+                elif language_client.status == self.RUNNING:
+                    self.restart_client(language, client_config)
+            else:
+                if language_client.status == self.RUNNING:
+                    language_client.instance.send_plugin_configurations(
+                        new_lang_config['configurations'])
 
     def restart_client(self, language, config):
         """Restart a client."""
         self.main.editor.stop_completion_services(language)
         self.main.projects.stop_lsp_services()
         self.close_client(language)
+        # The entry is installed directly, bypassing _ensure_client, so
+        # make sure its register queue exists (e.g. for a manual
+        # restart before any file was registered for the language).
         self.clients[language] = config
+        self.register_queue.setdefault(language, [])
         self.start_client(language)
 
     def update_client_status(self, active_set):
@@ -548,14 +763,16 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
                 self.close_client(language)
 
     def close_client(self, language):
-        if language in self.clients:
-            language_client = self.clients[language]
-            if language_client['status'] == self.RUNNING:
+        language_client = self.clients.get(language)
+        if language_client is not None:
+            with self._clients_lock:
+                running = language_client.status == self.RUNNING
+                language_client.status = self.STOPPED
+            if running:
                 logger.info("Stopping LSP client for {}...".format(language))
-                # language_client['instance'].shutdown()
-                # language_client['instance'].exit()
-                language_client['instance'].stop()
-            language_client['status'] = self.STOPPED
+                # language_client.instance.shutdown()
+                # language_client.instance.exit()
+                language_client.instance.stop()
 
     def receive_response(self, response_type, response, language, req_id):
         if req_id in self.requests:
@@ -564,24 +781,24 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
                 self.COMPLETION_CLIENT_NAME, req_id, response)
 
     def send_request(self, language, request, params, req_id):
-        if language in self.clients:
-            language_client = self.clients[language]
-            if language_client['status'] == self.RUNNING:
-                self.requests.add(req_id)
-                client = self.clients[language]['instance']
-                params['response_callback'] = functools.partial(
-                    self.receive_response, language=language, req_id=req_id)
-                client.perform_request(request, params)
-                return
+        # This runs per keystroke, so the client entry is resolved with
+        # a single lookup.
+        language_client = self.clients.get(language)
+        if language_client is not None and \
+                language_client.status == self.RUNNING:
+            self.requests.add(req_id)
+            params['response_callback'] = functools.partial(
+                self.receive_response, language=language, req_id=req_id)
+            language_client.instance.perform_request(request, params)
+            return
         self.sig_response_ready.emit(self.COMPLETION_CLIENT_NAME,
                                      req_id, {})
 
     def send_notification(self, language, request, params):
-        if language in self.clients:
-            language_client = self.clients[language]
-            if language_client['status'] == self.RUNNING:
-                client = self.clients[language]['instance']
-                client.perform_request(request, params)
+        language_client = self.clients.get(language)
+        if language_client is not None and \
+                language_client.status == self.RUNNING:
+            language_client.instance.perform_request(request, params)
 
     def broadcast_notification(self, request, params):
         """Send notification/request to all available LSP servers."""
@@ -592,94 +809,99 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
             for language in self.clients:
                 self.send_notification(language, request, params)
 
+    def _get_option_list(self, option):
+        """Get a comma-separated option as a list of stripped values."""
+        values = self.get_option(option).split(',')
+        return [value.strip() for value in values if value]
+
     def generate_python_config(self):
         """
         Update Python server configuration with the options saved in our
         config system.
         """
-        python_config = PYTHON_CONFIG.copy()
+        # A deep copy is needed here: a shallow one would share the
+        # nested plugin dicts with the module-level template, so the
+        # updates below would leak into PYTHON_CONFIG and into configs
+        # generated afterwards (possibly concurrently).
+        python_config = copy.deepcopy(PYTHON_CONFIG)
+
+        # Bind these once: this method reads ~20 options per call and
+        # each get_option call goes through CONF.
+        get_option = self.get_option
+        get_option_list = self._get_option_list
 
         # Server options
-        cmd = self.get_option('advanced/module')
-        host = self.get_option('advanced/host')
-        port = self.get_option('advanced/port')
+        cmd = get_option('advanced/module')
+        host = get_option('advanced/host')
+        port = get_option('advanced/port')
 
         # Pycodestyle
-        cs_exclude = self.get_option('pycodestyle/exclude').split(',')
-        cs_filename = self.get_option('pycodestyle/filename').split(',')
-        cs_select = self.get_option('pycodestyle/select').split(',')
-        cs_ignore = self.get_option('pycodestyle/ignore').split(',')
-        cs_max_line_length = self.get_option('pycodestyle/max_line_length')
-
         pycodestyle = {
-            'enabled': self.get_option('pycodestyle'),
-            'exclude': [exclude.strip() for exclude in cs_exclude if exclude],
-            'filename': [filename.strip()
-                         for filename in cs_filename if filename],
-            'select': [select.strip() for select in cs_select if select],
-            'ignore': [ignore.strip() for ignore in cs_ignore if ignore],
+            'enabled': get_option('pycodestyle'),
+            'exclude': get_option_list('pycodestyle/exclude'),
+            'filename': get_option_list('pycodestyle/filename'),
+            'select': get_option_list('pycodestyle/select'),
+            'ignore': get_option_list('pycodestyle/ignore'),
             'hangClosing': False,
-            'maxLineLength': cs_max_line_length
+            'maxLineLength': get_option('pycodestyle/max_line_length')
         }
 
         # Linting - Pyflakes
         pyflakes = {
-            'enabled': self.get_option('pyflakes')
+            'enabled': get_option('pyflakes')
         }
 
         # Pydocstyle
-        convention = self.get_option('pydocstyle/convention')
+        convention = get_option('pydocstyle/convention')
 
         if convention == 'Custom':
-            ds_ignore = self.get_option('pydocstyle/ignore').split(',')
-            ds_select = self.get_option('pydocstyle/select').split(',')
+            ds_ignore = get_option_list('pydocstyle/ignore')
+            ds_select = get_option_list('pydocstyle/select')
             ds_add_ignore = []
             ds_add_select = []
         else:
             ds_ignore = []
             ds_select = []
-            ds_add_ignore = self.get_option('pydocstyle/ignore').split(',')
-            ds_add_select = self.get_option('pydocstyle/select').split(',')
+            ds_add_ignore = get_option_list('pydocstyle/ignore')
+            ds_add_select = get_option_list('pydocstyle/select')
 
         pydocstyle = {
-            'enabled': self.get_option('pydocstyle'),
+            'enabled': get_option('pydocstyle'),
             'convention': convention,
-            'addIgnore': [ignore.strip()
-                          for ignore in ds_add_ignore if ignore],
-            'addSelect': [select.strip()
-                          for select in ds_add_select if select],
-            'ignore': [ignore.strip() for ignore in ds_ignore if ignore],
-            'select': [select.strip() for select in ds_select if select],
-            'match': self.get_option('pydocstyle/match'),
-            'matchDir': self.get_option('pydocstyle/match_dir')
+            'addIgnore': ds_add_ignore,
+            'addSelect': ds_add_select,
+            'ignore': ds_ignore,
+            'select': ds_select,
+            'match': get_option('pydocstyle/match'),
+            'matchDir': get_option('pydocstyle/match_dir')
         }
 
         # Jedi configuration
-        if self.get_option('default', section='main_interpreter'):
+        if get_option('default', section='main_interpreter'):
             environment = None
         else:
-            environment = self.get_option('custom_interpreter',
-                                          section='main_interpreter')
+            environment = get_option('custom_interpreter',
+                                     section='main_interpreter')
         jedi = {
             'environment': environment,
-            'extra_paths': self.get_option('spyder_pythonpath',
-                                           section='main', default=[]),
+            'extra_paths': get_option('spyder_pythonpath',
+                                      section='main', default=[]),
         }
         jedi_completion = {
-            'enabled': self.get_option('code_completion'),
-            'include_params':  self.get_option('code_snippets')
+            'enabled': get_option('code_completion'),
+            'include_params':  get_option('code_snippets')
         }
         jedi_signature_help = {
-            'enabled': self.get_option('jedi_signature_help')
+            'enabled': get_option('jedi_signature_help')
         }
         jedi_definition = {
-            'enabled': self.get_option('jedi_definition'),
-            'follow_imports': self.get_option('jedi_definition/follow_imports')
+            'enabled': get_option('jedi_definition'),
+            'follow_imports': get_option('jedi_definition/follow_imports')
         }
 
         # Advanced
-        external_server = self.get_option('advanced/external')
-        stdio = self.get_option('advanced/stdio')
+        external_server = get_option('advanced/external')
+        stdio = get_option('advanced/stdio')
 
         # Setup options in json
         python_config['cmd'] = cmd
@@ -701,6 +923,6 @@ class LanguageServerPlugin(SpyderCompletionPlugin):
         plugins['jedi_completion'].update(jedi_completion)
         plugins['jedi_signature_help'].update(jedi_signature_help)
         plugins['jedi_definition'].update(jedi_definition)
-        plugins['preload']['modules'] = self.get_option('preload_modules')
+        plugins['preload']['modules'] = get_option('preload_modules')
 
         return python_config
@@ -31,6 +31,14 @@ class DocumentProvider:
             self.watched_files[filename] = []
         self.watched_files[filename].append(codeeditor)
 
+    def register_files(self, pairs):
+        """
+        Register several (filename, codeeditor) pairs at once, e.g. the
+        files queued up while the client was starting.
+        """
+        for filename, codeeditor in pairs:
+            self.register_file(filename, codeeditor)
+
     @handles(LSPRequestTypes.DOCUMENT_PUBLISH_DIAGNOSTICS)
     def process_document_diagnostics(self, response, *args):
         uri = response['uri']
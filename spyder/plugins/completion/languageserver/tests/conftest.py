@@ -151,3 +151,22 @@ def lsp_context(is_stdio):
 
 lsp_manager = lsp_context(is_stdio=False)
 lsp_stdio_manager = lsp_context(is_stdio=True)
+
+
+@pytest.fixture
+def lsp_manager_no_servers(qtbot_module, request):
+    """
+    Create a manager that doesn't start any server, to test its
+    bookkeeping in isolation.
+    """
+    # Ensure the manager won't spawn servers while testing.
+    use_introspection = os.environ.pop('SPY_TEST_USE_INTROSPECTION', None)
+    manager = LanguageServerPlugin(parent=MainWindowMock())
+
+    def teardown():
+        manager.shutdown()
+        if use_introspection is not None:
+            os.environ['SPY_TEST_USE_INTROSPECTION'] = use_introspection
+
+    request.addfinalizer(teardown)
+    return manager
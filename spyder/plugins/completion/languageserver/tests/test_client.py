@@ -31,7 +31,7 @@ class CompletionManager(QObject):
 def lsp_client_and_completion(request):
     """Create an LSP client/completion pair."""
     completion = CompletionManager()
-    client = request.param.clients['python']['instance']
+    client = request.param.clients['python'].instance
     return client, completion
 
 
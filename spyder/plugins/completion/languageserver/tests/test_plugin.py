@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the LSP manager bookkeeping (no server is started)."""
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock  # Python 2
+
+from spyder.plugins.completion.languageserver.client import LSPClient
+from spyder.plugins.completion.languageserver.plugin import _ClientEntry
+
+
+def test_lazy_client_entries(lsp_manager_no_servers):
+    """Client entries are only created when a language is first used."""
+    manager = lsp_manager_no_servers
+
+    # No entries are created at startup.
+    assert manager.clients == {}
+
+    # Languages without a configured server don't get an entry.
+    assert manager._ensure_client('elm') is None
+    assert 'elm' not in manager.clients
+
+    # First use creates the entry together with its register queue.
+    entry = manager._ensure_client('python')
+    assert entry is manager.clients['python']
+    assert entry.status == manager.STOPPED
+    assert entry.instance is None
+    assert manager.register_queue['python'] == []
+
+    # Later uses return the same entry.
+    assert manager._ensure_client('python') is entry
+
+
+def test_register_file_queued_before_start(lsp_manager_no_servers):
+    """Files registered before the client starts are queued for it."""
+    manager = lsp_manager_no_servers
+    codeeditor = Mock()
+    manager.register_file('python', 'test.py', codeeditor)
+    assert manager.register_queue['python'] == [('test.py', codeeditor)]
+
+
+def test_restart_client_creates_register_queue(lsp_manager_no_servers):
+    """
+    A restart for a language without registered files must create the
+    register queue along with the entry (the entry is installed
+    directly, without going through _ensure_client).
+    """
+    manager = lsp_manager_no_servers
+    config = _ClientEntry(manager.STOPPED,
+                          manager.get_language_config('python'))
+    manager.register_queue.pop('python', None)
+    manager.restart_client('python', config)
+    assert manager.clients['python'] is config
+    assert manager.register_queue['python'] == []
+
+
+def test_config_updates_are_debounced(lsp_manager_no_servers, qtbot):
+    """A burst of scheduled configuration updates is collapsed into one."""
+    manager = lsp_manager_no_servers
+    calls = []
+    manager.update_configuration = (
+        lambda python_only=False: calls.append(python_only))
+
+    # One of the scheduled updates is a full one, so the collapsed
+    # update must be a full one too.
+    manager.schedule_update_configuration(python_only=True)
+    manager.schedule_update_configuration()
+    manager.schedule_update_configuration(python_only=True)
+    qtbot.waitUntil(lambda: len(calls) == 1)
+    assert calls == [False]
+
+    # The python_only state doesn't leak into the next burst.
+    manager.schedule_update_configuration(python_only=True)
+    qtbot.waitUntil(lambda: len(calls) == 2)
+    assert calls[1] is True
+
+
+def test_select_server_port_reuses_prior_port():
+    """A port verified earlier in the session is reused without probing."""
+    settings = {'cmd': 'pyls', 'args': '', 'host': '127.0.0.1',
+                'port': 2087, 'external': False, 'stdio': False}
+
+    client = LSPClient(None, server_settings=settings, prior_port=12345)
+    try:
+        assert client.select_server_port() == 12345
+    finally:
+        client.context.destroy(linger=0)
+
+    # Without a prior port the configured one is probed as usual.
+    client = LSPClient(None, server_settings=settings)
+    try:
+        assert client.select_server_port() >= 2087
+    finally:
+        client.context.destroy(linger=0)
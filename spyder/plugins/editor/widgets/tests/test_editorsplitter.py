@@ -408,7 +408,7 @@ def test_lsp_splitter_close(editor_splitter_lsp):
     editorsplitter, lsp_manager = editor_splitter_lsp
 
     editorsplitter.split()
-    lsp_files = lsp_manager.clients['python']['instance'].watched_files
+    lsp_files = lsp_manager.clients['python'].instance.watched_files
     editor = editorsplitter.editorstack.get_current_editor()
     path = pathlib.Path(osp.abspath(editor.filename)).as_uri()
     assert len(lsp_files[path]) == 2
@@ -418,7 +418,7 @@ def test_lsp_splitter_close(editor_splitter_lsp):
 
     last_editorstack = editorstacks[0][0]
     last_editorstack.close()
-    lsp_files = lsp_manager.clients['python']['instance'].watched_files
+    lsp_files = lsp_manager.clients['python'].instance.watched_files
     assert len(lsp_files[path]) == 1
 
 